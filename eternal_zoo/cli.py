@@ -16,7 +16,8 @@ from eternal_zoo.utils import find_gguf_files
 from eternal_zoo.manager import EternalZooManager
 from eternal_zoo.upload import upload_folder_to_lighthouse
 from eternal_zoo.constants import DEFAULT_MODEL_DIR, POSTFIX_MODEL_PATH
-from eternal_zoo.models import HASH_TO_MODEL, FEATURED_MODELS, MODEL_TO_HASH
+from eternal_zoo import models as zoo_models
+from eternal_zoo.models import get_task, hash_to_model, model_to_hash
 from eternal_zoo.download import download_model_async, fetch_model_metadata_async
 
 manager = EternalZooManager()
@@ -80,7 +81,7 @@ def print_warning(message):
 
 def show_available_models():
     """Display available models"""
-    for model_name in FEATURED_MODELS:
+    for model_name in zoo_models.FEATURED_MODELS:
         print(f"  {model_name}")
 
 class CustomHelpFormatter(argparse.HelpFormatter):
@@ -501,11 +502,11 @@ def handle_download(args) -> bool:
     """Handle model download with beautiful output"""
     if args.hash:
         # Download by hash
-        if args.hash not in HASH_TO_MODEL:
+        model_name = hash_to_model(args.hash)
+        if model_name is None:
             print_error(f"Hash {args.hash} not found in HASH_TO_MODEL")
             sys.exit(1)
-        model_name = HASH_TO_MODEL[args.hash]
-        hf_data = FEATURED_MODELS[model_name]
+        hf_data = zoo_models.CID_TO_CONFIG[args.hash].to_hf_data()
         success, local_path = asyncio.run(download_model_async(hf_data, args.hash))
         # Prepare and persist model metadata JSON (merge with fetched metadata if exists)
         if success:
@@ -534,7 +535,7 @@ def handle_download(args) -> bool:
                 "model_id": args.hash,
                 "model_name": (existing_meta.get("model_name")
                                 or (fetched_meta or {}).get("folder_name")
-                                or HASH_TO_MODEL.get(args.hash, args.hash)),
+                                or model_name),
                 "lora": (existing_meta.get("lora")
                           if existing_meta.get("lora") is not None else (fetched_meta or {}).get("lora", hf_data.get("lora", False))),
                 "architecture": existing_meta.get("architecture") or hf_data.get("architecture", None),
@@ -545,12 +546,13 @@ def handle_download(args) -> bool:
             with open(model_metadata_path, "w") as f:
                 json.dump(merged, f)
     elif args.model_name:
-        if args.model_name in MODEL_TO_HASH:
-            args.hash = MODEL_TO_HASH[args.model_name]
-        if args.model_name not in FEATURED_MODELS:
+        model_hash = model_to_hash(args.model_name)
+        if model_hash is not None:
+            args.hash = model_hash
+        if args.model_name not in zoo_models.FEATURED_MODELS:
             print_error(f"Model name {args.model_name} not found in FEATURED_MODELS")
             sys.exit(1)
-        hf_data = FEATURED_MODELS[args.model_name]
+        hf_data = zoo_models.FEATURED_MODELS[args.model_name].to_hf_data()
         success, local_path = asyncio.run(download_model_async(hf_data, args.hash))
         # Save metadata for named featured models
         if success:
@@ -657,7 +659,7 @@ def _determine_model_id_from_args(args) -> str:
     if getattr(args, 'hash', None):
         return args.hash
     if getattr(args, 'model_name', None):
-        return MODEL_TO_HASH.get(args.model_name, args.model_name)
+        return model_to_hash(args.model_name) or args.model_name
 
     # HF repo case
     if getattr(args, 'hf_repo', None):
@@ -717,17 +719,17 @@ def handle_run(args):
 
             # Compose an args-like object for handle_download
             # Priority: featured name in `model`, else `hf_repo`
-            if "model" in model_config and model_config["model"] in FEATURED_MODELS:
+            if "model" in model_config and model_config["model"] in zoo_models.FEATURED_MODELS:
                 featured_model_name = model_config["model"]
                 temp_args = argparse.Namespace(
-                    hash=MODEL_TO_HASH.get(featured_model_name),
+                    hash=model_to_hash(featured_model_name),
                     model_name=featured_model_name,
                     hf_repo=None,
                     hf_file=None,
                     mmproj=None,
                     pattern=None,
                     backend=model_config.get("backend"),
-                    task=model_config.get("task", FEATURED_MODELS[featured_model_name].get("task", "chat"))
+                    task=model_config.get("task", get_task(featured_model_name).label)
                 )
             elif "hf_repo" in model_config:
                 temp_args = argparse.Namespace(
@@ -803,17 +805,18 @@ def handle_run(args):
 
     # Handle hash or model_name cases
     if args.hash:
-        if args.hash not in HASH_TO_MODEL:
+        model_name = hash_to_model(args.hash)
+        if model_name is None:
             print_error(f"Hash {args.hash} not found in HASH_TO_MODEL")
             sys.exit(1)
-        model_name = HASH_TO_MODEL[args.hash]
     elif args.model_name:
-        if args.model_name not in FEATURED_MODELS:
+        if args.model_name not in zoo_models.FEATURED_MODELS:
             print_error(f"Model name {args.model_name} not found in FEATURED_MODELS")
             sys.exit(1)
         model_name = args.model_name
-        if model_name in MODEL_TO_HASH:
-            args.hash = MODEL_TO_HASH[model_name]
+        model_hash = model_to_hash(model_name)
+        if model_hash is not None:
+            args.hash = model_hash
     else:
         print_error("Either hash, model_name, or hf_repo must be provided")
         sys.exit(1)
@@ -823,7 +826,7 @@ def handle_run(args):
     if args.hash:
         model_id = args.hash
     elif args.model_name:
-        model_id = MODEL_TO_HASH.get(args.model_name, args.model_name)
+        model_id = model_to_hash(args.model_name) or args.model_name
     else:
         print_error("Either hash, model_name, or hf_repo must be provided")
         sys.exit(1)
@@ -979,16 +982,16 @@ def _handle_lora_base_model(lora_metadata):
         print_warning("LoRA metadata missing base_model hash")
         return None
         
-    if base_model_hash not in HASH_TO_MODEL:
+    base_model_name = hash_to_model(base_model_hash)
+    if base_model_name is None:
         print_warning(f"Base model hash {base_model_hash} not found")
         return None
-    
-    base_model_name = HASH_TO_MODEL[base_model_hash]
-    if base_model_name not in FEATURED_MODELS:
+
+    base_model_spec = zoo_models.CID_TO_CONFIG.get(base_model_hash)
+    if base_model_spec is None:
         print_warning(f"Base model {base_model_name} not in featured models")
         return None
-        
-    base_model_hf_data = FEATURED_MODELS[base_model_name]
+    base_model_hf_data = base_model_spec.to_hf_data()
     
     try:
         success, base_model_local_path = asyncio.run(
@@ -1122,11 +1125,11 @@ def handle_check(args):
     
     if getattr(args, 'model_name', None):
         model_name = args.model_name
-        if model_name not in FEATURED_MODELS:
+        if model_name not in zoo_models.FEATURED_MODELS:
             print_error(f"Model name {model_name} not found in FEATURED_MODELS")
             sys.exit(1)
-        if model_name in MODEL_TO_HASH:
-            model_hash = MODEL_TO_HASH[model_name]
+        model_hash = model_to_hash(model_name)
+        if model_hash is not None:
             local_path = DEFAULT_MODEL_DIR / (model_hash + POSTFIX_MODEL_PATH)
             print_info(f"Local path: {local_path}")
             if local_path.exists():
@@ -1135,7 +1138,7 @@ def handle_check(args):
                 print_info("False")
             return
         else:
-            hf_data = FEATURED_MODELS[model_name]
+            hf_data = zoo_models.FEATURED_MODELS[model_name].to_hf_data()
 
     local_path = DEFAULT_MODEL_DIR / hf_data.get("repo", "").replace("/", "_")
         
@@ -9,7 +9,7 @@ from pathlib import Path
 from loguru import logger
 from huggingface_hub import HfApi
 from eternal_zoo.utils import async_move, async_rmtree, compute_file_hash
-from eternal_zoo.models import FEATURED_MODELS, HASH_TO_MODEL
+from eternal_zoo import models as zoo_models
 from eternal_zoo.constants import DEFAULT_MODEL_DIR, POSTFIX_MODEL_PATH, GATEWAY_URLS, ETERNAL_AI_METADATA_GW, PREFIX_DOWNLOAD_LOG
 
 SLEEP_TIME = 2
@@ -241,9 +241,8 @@ async def download_model_async_by_hash(hf_data: dict, filecoin_hash: str) -> tup
             else:
                 logger.warning(f"LoRA model exists but base model not found at {lora_base_model_path_str}")
                 logger.info(f"Downloading missing base model: {base_model_hash}")
-                base_model_hf_data = None
-                if base_model_hash in HASH_TO_MODEL:
-                    base_model_hf_data = FEATURED_MODELS[HASH_TO_MODEL[base_model_hash]]
+                base_model_spec = zoo_models.CID_TO_CONFIG.get(base_model_hash)
+                base_model_hf_data = base_model_spec.to_hf_data() if base_model_spec else None
                 success, base_model_path = await download_model_async_by_hash(base_model_hf_data, base_model_hash)
                 if not success:
                     logger.error(f"Failed to download base model: {base_model_hash}")
@@ -282,10 +281,8 @@ async def download_model_async_by_hash(hf_data: dict, filecoin_hash: str) -> tup
             logger.error("No base_model found in LoRA metadata")
             return False, None
 
-        base_model_hf_data = None
-
-        if base_model_hash in HASH_TO_MODEL:
-            base_model_hf_data = FEATURED_MODELS[HASH_TO_MODEL[base_model_hash]]
+        base_model_spec = zoo_models.CID_TO_CONFIG.get(base_model_hash)
+        base_model_hf_data = base_model_spec.to_hf_data() if base_model_spec else None
 
         print(f"base_model_hf_data: {base_model_hf_data}")
         print(f"base_model_hash: {base_model_hash}")
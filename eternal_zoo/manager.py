@@ -13,6 +13,7 @@ import pkg_resources
 from pathlib import Path
 from loguru import logger
 from eternal_zoo.config import DEFAULT_CONFIG
+from eternal_zoo.models import Backend
 from eternal_zoo.utils import wait_for_health
 from typing import Optional, Dict, Any, List
 
@@ -993,66 +994,78 @@ class EternalZooManager:
             return False
         
     def _build_chat_command(self, config: dict) -> list:
-        """Build the chat command with common parameters."""
+        """Build the chat command for the model's backend."""
         model_path = config.get("model", None)
         if model_path is None:
             raise ValueError("Model path is required to start the service")
-        
-        hf_data = config.get("hf_data", None)
+
+        backend = Backend.from_label(config.get("backend", "gguf"))
+        build_command = self._CHAT_COMMAND_BUILDERS[backend]
+        if build_command is None:
+            raise ValueError(f"Unsupported backend: {backend.label}")
+        return build_command(self, config, model_path)
+
+    def _build_gguf_chat_command(self, config: dict, model_path: str) -> list:
+        """Build the llama-server chat command for a GGUF model."""
         model_name = config.get("model_name", None)
         model_family = self._get_model_family(model_name)
         template_path = self._get_model_template_path(model_family)
         best_practice_path = self._get_model_best_practice_path(model_family)
         projector = config.get("projector", None)
         context_length = config.get("context_length", 32768)
-        backend = config.get("backend", "gguf")
-
-        if backend == "gguf":
-            command = [
-                self.llama_server_path,
-                "--model", str(model_path),
-                "--pooling", "mean",
-                "--no-webui",
-                "--no-context-shift",
-                "-fa", "on",
-                "-ngl", "9999",
-                "-c", str(context_length),
-                "--embeddings",
-                "--jinja",
-            ]
-
-            if projector is not None:
-                if os.path.exists(projector):
-                    command.extend(["--mmproj", str(projector)])
-                else:
-                    raise ValueError(f"Projector file not found: {projector}")
-            
-            if template_path is not None:
-                if os.path.exists(template_path):
-                    command.extend(["--chat-template-file", template_path])
-                else:
-                    raise ValueError(f"Template file not found: {template_path}")
-            
-            if best_practice_path is not None:
-                if os.path.exists(best_practice_path):
-                    with open(best_practice_path, "r") as f:
-                        best_practice = json.load(f)
-                        for key, value in best_practice.items():
-                            command.extend([f"--{key}", str(value)])
-                else:
-                    raise ValueError(f"Best practices file not found: {best_practice_path}")
-        elif backend == "mlx-lm":
-            command = [
-                "mlx-openai-server",
-                "launch",
-                "--model-path", str(model_path),
-                "--model-type", "lm"
-            ]
-        else:
-            raise ValueError(f"Unsupported backend: {backend}")
+
+        command = [
+            self.llama_server_path,
+            "--model", str(model_path),
+            "--pooling", "mean",
+            "--no-webui",
+            "--no-context-shift",
+            "-fa", "on",
+            "-ngl", "9999",
+            "-c", str(context_length),
+            "--embeddings",
+            "--jinja",
+        ]
+
+        if projector is not None:
+            if os.path.exists(projector):
+                command.extend(["--mmproj", str(projector)])
+            else:
+                raise ValueError(f"Projector file not found: {projector}")
+        
+        if template_path is not None:
+            if os.path.exists(template_path):
+                command.extend(["--chat-template-file", template_path])
+            else:
+                raise ValueError(f"Template file not found: {template_path}")
+        
+        if best_practice_path is not None:
+            if os.path.exists(best_practice_path):
+                with open(best_practice_path, "r") as f:
+                    best_practice = json.load(f)
+                    for key, value in best_practice.items():
+                        command.extend([f"--{key}", str(value)])
+            else:
+                raise ValueError(f"Best practices file not found: {best_practice_path}")
 
         return command
 
+    def _build_mlx_lm_chat_command(self, config: dict, model_path: str) -> list:
+        """Build the mlx-openai-server chat command for an MLX LM model."""
+        return [
+            "mlx-openai-server",
+            "launch",
+            "--model-path", str(model_path),
+            "--model-type", "lm"
+        ]
+
+    # Chat command builders indexed by Backend; None marks backends that cannot serve chat
+    _CHAT_COMMAND_BUILDERS = (
+        _build_gguf_chat_command,     # Backend.GGUF
+        _build_mlx_lm_chat_command,   # Backend.MLX_LM
+        None,                         # Backend.MLX_FLUX
+    )
+
     def _build_embed_command(self, config: dict) -> list:
         """Build the embed command with common parameters."""
         model_path = config.get("model", None)
@@ -1,258 +1,281 @@
-HASH_TO_MODEL = {
-    "bafkreiacd5mwy4a5wkdmvxsk42nsupes5uf4q3dm52k36mvbhgdrez422y": "qwen3-embedding-0.6b",
-    "bafkreia7nzedkxlr6tebfxvo552zq7cba6sncloxwyivfl3tpj7hl5dz5u": "qwen3-embedding-4b",
-    "bafkreib6pws5dx5ur6exbhulmf35twfcizdkxvup4cklzprlvaervfz5zy": "qwen3-1.7b",
-    "bafkreiekokvzioogj5hoxgxlorqvbw2ed3w4mwieium5old5jq3iubixza": "qwen3-4b",
-    "bafkreid5z4lddvv4qbgdlz2nqo6eumxwetwmkpesrumisx72k3ahq73zpy": "qwen3-8b",
-    "bafkreiclwlxc56ppozipczuwkmgnlrxrerrvaubc5uhvfs3g2hp3lftrwm": "qwen3-14b",
-    "bafkreihq4usl2t3i6pqoilvorp4up263yieuxcqs6xznlmrig365bvww5i": "qwen3-32b",
-    "bafkreieroiopteqmtbjadlnpq3qkakdu7omvtuavs2l2qbu46ijnfdo2ly": "qwen3-30b-a3b",
-    "bafkreie4uj3gluik5ob2ib3cm2pt6ww7n4vqpmjnq6pas4gkkor42yuysa": "qwen3-235b-a22b",
-    "bafkreib6thkvzddxkxtgkeslioreae66uef42gtxzy4wh7cyzf6fmlq3rm": "qwen3-coder-480b-a35b",
-    "bafkreiaevddz5ssjnbkmdrl6dzw5sugwirzi7wput7z2ttcwnvj2wiiw5q": "gemma-3-4b",
-    "bafkreic2bkjuu3fvdoxnvusdt4in6fa6lubzhtjtmcp2zvokvfjpyndakq": "gemma-3-12b",
-    "bafkreihi2cbsgja5dwa5nsuixicx2x3gbcnh7gsocxbmjxegtewoq2syve": "gemma-3-27b",
-    "bafkreihz3mz422vpoy7sccwj5tujkerxbjxdlmsqqf3ridxbe3m6ipnq5i": "gemma-3n-e4b",
-    "bafkreiaztifhss23cftya3bkorbsenzohol2oc3dvngo2srbbosko6gmme": "lfm2-1.2b",
-    "bafkreidrdplo7mcfhrvocaa26yge6kmxmuwrexm5rffnzo5lbe6fkhjuvq": "openreasoning-nemotron-32b",
-    "bafkreih4xgr5t7yc3yooz6i6usgpwhggaobspmgut4rnu42gi6cv77o4em": "devstral-small",
-    "bafkreibokz6tdke7k3eozsro3hh3luyqbub7tzdawpswtt7q6bzfg36fw4": "dolphin-3.0-llama3.1-8b",
-    "bafkreiclhnqcjfbbusqmg73jcwasomv7tqchkqm3fea5wwzs5vavc2wzfq": "gpt-oss-20b",
-    "bafkreia4xtrb4vfsf7lblomjwh7cc3nlpci3fsqyeqpgqqflx4cnhwa3za": "gpt-oss-120b",
-    "bafkreicyuuvaeavozddtpc3tajfejaxuvuw2cpfajtt6lsddo22gcqg2km": "hermes-4-70b",
-    "bafkreiaha3sjfmv4affmi5kbu6bnayenf2avwafp3cthhar3latmfi632u": "flux-dev",
-    "bafkreibks5pmc777snbo7dwk26sympe2o24tpqfedjq6gmgghwwu7iio34": "flux-schnell",
-    "bafkreidbaksrogxispjejczfj36vtf5uzsbjt7irspl6kckynz5u2ugzke": "flux-dev-nsfw",
-    "bafkreihiaeosw2jlyvzo7od46ihe4iwutgmppqj5d7z74g25qljlcmcikq": "flux-dev-18-loras",
-    "bafkreidnd2n2sp3gw6c4iutvgdtupqa4qlpsznpjnwqmsna2ko3uhv4fce": "nsfw-lab",
-    "bafkreidl2y42rs2ymhydn7gojikgv657yy73yldu3nanjsljeepen6ftsy": "lora-lab"
-}
-
-MODEL_TO_HASH = {model: hash for hash, model in HASH_TO_MODEL.items()}
-
-FEATURED_MODELS = {
-    "qwen3-embedding-0.6b": {
-        "repo": "Qwen/Qwen3-Embedding-0.6B-GGUF",
-        "model": "Qwen3-Embedding-0.6B-Q8_0.gguf",
-        "task": "embed",
-        "backend": "gguf"
-    },
-    "qwen3-embedding-4b": {
-        "repo": "Qwen/Qwen3-Embedding-4B-GGUF",
-        "model": "Qwen3-Embedding-4B-Q8_0.gguf",
-        "task": "embed",
-        "backend": "gguf"
-    },
-    "qwen3-1.7b": {
-        "repo": "Qwen/Qwen3-1.7B-GGUF",
-        "model": "Qwen3-1.7B-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "qwen3-4b": {
-       "repo": "Qwen/Qwen3-4B-GGUF",
-       "model": "Qwen3-4B-Q8_0.gguf",
-       "task": "chat",
-       "backend": "gguf"
-    },
-    "qwen3-8b": {
-        "repo": "Qwen/Qwen3-8B-GGUF",
-        "model": "Qwen3-8B-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "qwen3-14b": {
-        "repo": "Qwen/Qwen3-14B-GGUF",
-        "model": "Qwen3-14B-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "qwen3-32b": {
-        "repo": "Qwen/Qwen3-32B-GGUF",
-        "model": "Qwen3-32B-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "qwen3-30b-a3b": {
-        "repo": "Qwen/Qwen3-30B-GGUF",
-        "model": "Qwen3-30B-A3B-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "qwen3-30b-a3b-instruct-2507": {
-        "repo": "unsloth/Qwen3-30B-A3B-Instruct-2507-GGUF",
-        "model": "Qwen3-30B-A3B-Instruct-2507-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "qwen3-30b-a3b-thinking-2507": {
-        "repo": "unsloth/Qwen3-30B-A3B-Thinking-2507-GGUF",
-        "model": "Qwen3-30B-A3B-Thinking-2507-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "qwen3-coder-30b-a3b-instruct": {
-        "repo": "unsloth/Qwen3-Coder-30B-A3B-Instruct-GGUF",
-        "model": "Qwen3-Coder-30B-A3B-Instruct-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "qwen3-235b-a22b": {
-        "repo": "unsloth/Qwen3-235B-A22B-Instruct-2507-GGUF",
-        "pattern": "Q4_K_M",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "qwen3-coder-480b-a35b": {
-        "repo": "unsloth/Qwen3-Coder-480B-A35B-Instruct-GGUF",
-        "pattern": "Q4_K_M",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "gemma-3-4b": {
-        "repo": "lmstudio-community/gemma-3-4B-it-qat-GGUF",
-        "model": "gemma-3-4B-it-QAT-Q4_0.gguf",
-        "projector": "mmproj-model-f16.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "gemma-3-12b": {
-        "repo": "lmstudio-community/gemma-3-12B-it-qat-GGUF",
-        "model": "gemma-3-12B-it-QAT-Q4_0.gguf",
-        "projector": "mmproj-model-f16.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "gemma-3-27b": {
-        "repo": "lmstudio-community/gemma-3-27B-it-qat-GGUF",
-        "model": "gemma-3-27B-it-QAT-Q4_0.gguf",
-        "projector": "mmproj-model-f16.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "gemma-3n-e4b": {
-        "repo": "unsloth/gemma-3n-E4B-it-GGUF",
-        "model": "gemma-3n-E4B-it-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "lfm2-1.2b": {
-        "repo": "LiquidAI/LFM2-1.2B-GGUF",
-        "model": "LFM2-1.2B-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "openreasoning-nemotron-32b": {
-        "repo": "lmstudio-community/OpenReasoning-Nemotron-32B-GGUF",
-        "model": "OpenReasoning-Nemotron-32B-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "devstral-small": {
-        "repo": "mistralai/Devstral-Small-2507_gguf",
-        "model": "Devstral-Small-2507-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "dolphin-3.0-llama3.1-8b": {
-        "repo": "dphn/Dolphin3.0-Llama3.1-8B-GGUF",
-        "model": "Dolphin3.0-Llama3.1-8B-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "gpt-oss-20b": {
-        "repo": "bartowski/openai_gpt-oss-20b-GGUF-MXFP4-Experimental",
-        "model": "openai_gpt-oss-20b-MXFP4.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "gpt-oss-120b": {
-        "repo": "ggml-org/gpt-oss-120b-GGUF",
-        "pattern": "mxfp4",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "gpt-oss-20b-mlx": {
-        "hf-repo": "lmstudio-community/gpt-oss-20b-GGUF",
-        "task": "chat",
-        "backend": "mlx-lm"
-    },
-    "qwen3-next-80b-a3b-instruct": {
-        "hf-repo": "lmstudio-community/Qwen3-Next-80B-A3B-Instruct-MLX-8bit",
-        "task": "chat",
-        "backend": "mlx-lm"
-    },
-    "qwen3-next-80b-a3b-thinking": {
-        "hf-repo": "lmstudio-community/Qwen3-Next-80B-A3B-Thinking-MLX-8bit",
-        "task": "chat",
-        "backend": "mlx-lm"
-    },
-    "hermes-4-14b": {
-        "repo": "bartowski/NousResearch_Hermes-4-14B-GGUF",
-        "model": "NousResearch_Hermes-4-14B-Q4_K_M.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "hermes-4-70b": {
-        "repo": "bartowski/NousResearch_Hermes-4-70B-GGUF",
-        "model": "NousResearch_Hermes-4-14B-Q8_0.gguf",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "hermes-4-405b": {
-        "repo": "lmstudio-community/Hermes-4-405B-GGUF",
-        "pattern": "Q4_K_M",
-        "task": "chat",
-        "backend": "gguf"
-    },
-    "flux-dev": {
-       "repo": "NikolaSigmoid/FLUX.1-dev",
-       "task": "image-generation",
-       "architecture": "flux-dev",
-       "backend": "mlx-flux"
-    },
-    "flux-schnell": {
-        "repo": "NikolaSigmoid/FLUX.1-schnell",
-        "task": "image-generation",
-        "architecture": "flux-schnell",
-        "backend": "mlx-flux"
-    },
-    "flux-krea-dev": {
-        "repo": "NikolaSigmoid/FLUX.1-Krea-dev",
-        "task": "image-generation",
-        "architecture": "flux-dev",
-        "backend": "mlx-flux"
-    },
-    "flux-dev-nsfw": {
-        "repo": "NikolaSigmoid/FLUX.1-dev-NSFW-Master",
-        "task": "image-generation",
-        "lora": True,
-        "base_model": "flux-dev",
-        "architecture": "flux-dev",
-        "backend": "mlx-flux"
-    },
-    "flux-dev-18-loras": {
-        "repo": "NikolaSigmoid/FLUX.1-dev-18-loras",
-        "task": "image-generation",
-        "lora": True,
-        "base_model": "flux-dev",
-        "architecture": "flux-dev",
-        "backend": "mlx-flux"
-    },
-    "nsfw-lab": {
-       "repo": "NikolaSigmoid/NSFW-Lab",
-       "task": "image-generation",
-       "lora": True,
-       "base_model": "flux-schnell",
-       "architecture": "flux-schnell",
-       "backend": "mlx-flux"
-    },
-    "lora-lab": {
-        "repo": "NikolaSigmoid/lora-lab",
-        "task": "image-generation",
-        "lora": True,
-        "base_model": "flux-dev",
-        "architecture": "flux-dev",
-        "backend": "mlx-flux"
+import os
+import sys
+import marshal
+from enum import IntEnum
+from typing import NamedTuple
+from types import MappingProxyType
+
+# The model tables live in models.toml. The parsed result is cached with marshal
+# next to the package bytecode and reused while the mtime and size of both the
+# TOML file and this module are unchanged, so a normal import does not re-parse
+# it and a change to the parsing code invalidates the cache. marshal is built
+# into the interpreter and, unlike pickle or tomllib, costs nothing to import;
+# its format is interpreter-specific, hence the cache_tag in the file name.
+_PACKAGE_DIR = os.path.dirname(__file__)
+_DATA_PATH = os.path.join(_PACKAGE_DIR, "models.toml")
+
+
+def _cache_dir() -> str:
+    """Return the directory for the cache, honouring sys.pycache_prefix like bytecode does."""
+    if sys.pycache_prefix:
+        package_dir = os.path.splitdrive(os.path.abspath(_PACKAGE_DIR))[1]
+        return os.path.join(sys.pycache_prefix, package_dir.lstrip(os.sep + (os.altsep or "")))
+    return os.path.join(_PACKAGE_DIR, "__pycache__")
+
+
+_CACHE_PATH = os.path.join(_cache_dir(), f"models.toml.{sys.implementation.cache_tag}.marshal")
+
+# Config fields whose values repeat across featured models. Interned when
+# FEATURED_MODELS is built (the cache does not guarantee interned strings), so
+# every entry shares one object and equality checks hit the identity fast path.
+_INTERNED_FIELDS = ("task", "backend", "architecture", "base_model", "projector", "pattern")
+
+_TASK_CHAT = sys.intern("chat")
+_TASK_EMBED = sys.intern("embed")
+_TASK_IMAGE_GENERATION = sys.intern("image-generation")
+_BACKEND_GGUF = sys.intern("gguf")
+_BACKEND_MLX_LM = sys.intern("mlx-lm")
+_BACKEND_MLX_FLUX = sys.intern("mlx-flux")
+
+_TASK_LABELS = (_TASK_CHAT, _TASK_EMBED, _TASK_IMAGE_GENERATION)
+_BACKEND_LABELS = (_BACKEND_GGUF, _BACKEND_MLX_LM, _BACKEND_MLX_FLUX)
+
+
+class Task(IntEnum):
+    """Integer tag for the task a featured model serves."""
+    CHAT = 0
+    EMBED = 1
+    IMAGE_GENERATION = 2
+
+    @property
+    def label(self) -> str:
+        """String form used in FEATURED_MODELS and saved model metadata."""
+        return _TASK_LABELS[self]
+
+    @classmethod
+    def from_label(cls, label: str) -> "Task":
+        """Return the member for a task string. Raises ValueError for unknown tasks."""
+        try:
+            return _TASKS_BY_LABEL[label]
+        except KeyError:
+            raise ValueError(f"Unsupported task: {label}") from None
+
+
+class Backend(IntEnum):
+    """Integer tag for the runtime backend of a featured model."""
+    GGUF = 0
+    MLX_LM = 1
+    MLX_FLUX = 2
+
+    @property
+    def label(self) -> str:
+        """String form used in FEATURED_MODELS and saved model metadata."""
+        return _BACKEND_LABELS[self]
+
+    @classmethod
+    def from_label(cls, label: str) -> "Backend":
+        """Return the member for a backend string. Raises ValueError for unknown backends."""
+        try:
+            return _BACKENDS_BY_LABEL[label]
+        except KeyError:
+            raise ValueError(f"Unsupported backend: {label}") from None
+
+
+_TASKS_BY_LABEL = {member.label: member for member in Task}
+_BACKENDS_BY_LABEL = {member.label: member for member in Backend}
+
+# ModelSpec.flags layout: bit 0 marks a LoRA adapter, bits 1-3 index _ARCHITECTURES
+# and the bits from 4 up index _BASE_MODELS. Index 0 means the field is not set.
+# _BASE_MODELS is built from the featured mlx-flux models when models.toml is
+# loaded (see _parse_data), so adding a base model only needs a TOML entry; run
+# `make check-models` after adding LoRA entries.
+_FLAG_LORA = 0x1
+_ARCHITECTURE_SHIFT = 1
+_BASE_MODEL_SHIFT = 4
+_ARCHITECTURE_MASK = 0x7
+_ARCHITECTURES = (None, sys.intern("flux-dev"), sys.intern("flux-schnell"))
+
+
+def _pack_flags(lora: bool, architecture: str | None, base_model: str | None) -> int:
+    """Encode the LoRA/architecture/base model fields into a ModelSpec.flags value."""
+    if architecture not in _ARCHITECTURES:
+        raise ValueError(f"Unknown architecture: {architecture}")
+    if base_model not in _BASE_MODELS:
+        raise ValueError(f"Unknown base model: {base_model}")
+    return (
+        (_FLAG_LORA if lora else 0)
+        | _ARCHITECTURES.index(architecture) << _ARCHITECTURE_SHIFT
+        | _BASE_MODELS.index(base_model) << _BASE_MODEL_SHIFT
+    )
+
+
+class ModelSpec(NamedTuple):
+    """Download and runtime configuration of a featured model."""
+    task: Task
+    backend: Backend
+    repo: str | None = None
+    model: str | None = None
+    projector: str | None = None
+    pattern: str | None = None
+    hf_repo: str | None = None
+    flags: int = 0
+
+    @property
+    def lora(self) -> bool:
+        """Whether the model is a LoRA adapter on top of base_model."""
+        return bool(self.flags & _FLAG_LORA)
+
+    @property
+    def architecture(self) -> str | None:
+        """Image generation architecture, or None for non-diffusion models."""
+        return _ARCHITECTURES[self.flags >> _ARCHITECTURE_SHIFT & _ARCHITECTURE_MASK]
+
+    @property
+    def base_model(self) -> str | None:
+        """Featured model name a LoRA adapter applies to, or None."""
+        return _BASE_MODELS[self.flags >> _BASE_MODEL_SHIFT]
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ModelSpec":
+        """Build a spec from a [models] table of models.toml."""
+        config = dict(config)
+        config["task"] = Task.from_label(config["task"])
+        config["backend"] = Backend.from_label(config["backend"])
+        if "hf-repo" in config:
+            config["hf_repo"] = config.pop("hf-repo")
+        config["flags"] = _pack_flags(
+            config.pop("lora", False),
+            config.pop("architecture", None),
+            config.pop("base_model", None),
+        )
+        return cls(**config)
+
+    def to_hf_data(self) -> dict:
+        """Return the plain hf_data dict used by the download helpers and saved in metadata."""
+        hf_data = {}
+        for field, value in zip(self._fields, self):
+            if field == "flags" or value is None:
+                continue
+            if field in ("task", "backend"):
+                value = value.label
+            hf_data["hf-repo" if field == "hf_repo" else field] = value
+        if self.lora:
+            hf_data["lora"] = True
+        if self.architecture is not None:
+            hf_data["architecture"] = self.architecture
+        if self.base_model is not None:
+            hf_data["base_model"] = self.base_model
+        return hf_data
+
+
+def _parse_data() -> dict:
+    """Parse models.toml into the tables exposed by this module."""
+    # Imported here so a cache hit does not pay for tomllib and its dependencies
+    import tomllib
+
+    with open(_DATA_PATH, "rb") as f:
+        data = tomllib.load(f)
+    return {
+        "hashes": data["hashes"],
+        "model_to_hash": {model: cid for cid, model in data["hashes"].items()},
+        "models": data["models"],
+        # Models a LoRA adapter can apply to: every featured mlx-flux model that is
+        # not itself an adapter. Index 0 is reserved for "no base model".
+        "base_models": (None, *(
+            name for name, config in data["models"].items()
+            if config.get("backend") == _BACKEND_MLX_FLUX and not config.get("lora")
+        )),
     }
-}
\ No newline at end of file
+
+
+def _load_data() -> dict:
+    """Return the parsed models.toml, from the marshal cache when it is still valid."""
+    data_stat = os.stat(_DATA_PATH)
+    source_stat = os.stat(__file__)
+    cache_key = (
+        data_stat.st_mtime_ns, data_stat.st_size,
+        source_stat.st_mtime_ns, source_stat.st_size,
+    )
+    try:
+        with open(_CACHE_PATH, "rb") as f:
+            cached_key, data = marshal.load(f)
+        if cached_key == cache_key:
+            return data
+    except Exception:
+        # Missing, stale-format or corrupt cache: fall back to parsing the TOML
+        pass
+
+    data = _parse_data()
+    if sys.dont_write_bytecode:
+        # Same opt-out as for .pyc files (PYTHONDONTWRITEBYTECODE / -B)
+        return data
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            marshal.dump((cache_key, data), f)
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        # Read-only install: keep working without a cache
+        pass
+    return data
+
+
+_DATA = _load_data()
+HASH_TO_MODEL = _DATA["hashes"]
+MODEL_TO_HASH = _DATA["model_to_hash"]
+_BASE_MODELS = tuple(name and sys.intern(name) for name in _DATA["base_models"])
+
+
+# The raw featured configs are loaded with the hash tables at import, but
+# FEATURED_MODELS and CID_TO_CONFIG are built from them on first use by
+# _load_featured_models(), so only code that needs the specs pays for interning
+# and ModelSpec construction.
+_LAZY_ATTRIBUTES = ("FEATURED_MODELS", "CID_TO_CONFIG")
+
+
+def _load_featured_models() -> None:
+    """Build FEATURED_MODELS and the tables derived from it."""
+    global FEATURED_MODELS, CID_TO_CONFIG
+    configs = _DATA["models"]
+    for config in configs.values():
+        for field in _INTERNED_FIELDS:
+            if field in config:
+                config[field] = sys.intern(config[field])
+
+    # Read-only view of immutable specs: the featured configs are shared module state,
+    # so any accidental mutation by a caller raises instead of leaking into other lookups.
+    featured = MappingProxyType({
+        name: ModelSpec.from_config(config) for name, config in configs.items()
+    })
+
+    # Direct hash -> spec index so resolving a hash is a single lookup rather than
+    # FEATURED_MODELS[HASH_TO_MODEL[hash]].
+    CID_TO_CONFIG = MappingProxyType({
+        cid: featured[name]
+        for cid, name in HASH_TO_MODEL.items()
+        if name in featured
+    })
+
+    FEATURED_MODELS = featured
+
+
+def __getattr__(name: str):
+    """Build the lazily-loaded featured model tables on first access (PEP 562)."""
+    if name in _LAZY_ATTRIBUTES:
+        _load_featured_models()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Bound dict.get methods rather than Python wrappers: a lookup is a single C call
+# with no Python frame. Both return None for unknown keys.
+hash_to_model = HASH_TO_MODEL.get  # IPFS hash -> featured model name
+model_to_hash = MODEL_TO_HASH.get  # featured model name -> IPFS hash
+
+
+def get_task(model_name: str) -> Task:
+    """Return the task of a featured model. Raises KeyError for unknown names."""
+    if "FEATURED_MODELS" not in globals():
+        _load_featured_models()
+    return FEATURED_MODELS[model_name].task
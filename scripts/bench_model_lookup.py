@@ -0,0 +1,129 @@
+"""
+Micro-benchmark for hash -> model name resolution in eternal_zoo/models.py.
+
+Compares the production lookup (hash_to_model, a bound dict.get) against
+alternative layouts so changes to the lookup tables can be measured
+rather than guessed.
+
+Usage:
+    python scripts/bench_model_lookup.py [--number N]
+"""
+
+import sys
+import zlib
+import bisect
+import timeit
+import argparse
+
+from models_module import load_models_module
+
+
+def make_sorted_lookup(hash_to_model: dict):
+    """Sorted tuple of hashes searched with bisect, names in a parallel tuple."""
+    sorted_hashes = tuple(sorted(hash_to_model))
+    names = tuple(hash_to_model[cid] for cid in sorted_hashes)
+    size = len(sorted_hashes)
+
+    def lookup(cid, bisect_left=bisect.bisect_left):
+        i = bisect_left(sorted_hashes, cid)
+        if i < size and sorted_hashes[i] == cid:
+            return names[i]
+        return None
+
+    return lookup
+
+
+def mix32(h: int) -> int:
+    """murmur3 fmix32 finalizer: a non-linear 32-bit mix.
+
+    crc32 is affine, so crc32(data, seed) only XORs a seed-dependent constant
+    into crc32(data); used directly as the displaced hash, no seed could ever
+    separate two keys of a bucket that collide once.
+    """
+    h ^= h >> 16
+    h = h * 0x85EBCA6B & 0xFFFFFFFF
+    h ^= h >> 13
+    h = h * 0xC2B2AE35 & 0xFFFFFFFF
+    return h ^ h >> 16
+
+
+def build_chd(keys: list[str], bucket_ratio: int = 4, max_seed: int = 1 << 16) -> tuple[list[int], list[str | None]]:
+    """Build a CHD minimal perfect hash over keys.
+
+    Keys are split into buckets by crc32; each bucket, largest first, gets the
+    smallest displacement seed for which mix32(crc32 ^ seed) places all of its
+    keys in free slots. Returns the per-bucket seeds and the slot -> key table.
+    Raises ValueError if a bucket needs a seed of max_seed or more (e.g. two
+    keys with the same crc32).
+    """
+    size = len(keys)
+    num_buckets = max(1, size // bucket_ratio)
+    crcs = {key: zlib.crc32(key.encode()) for key in keys}
+    buckets = [[] for _ in range(num_buckets)]
+    for key in keys:
+        buckets[crcs[key] % num_buckets].append(key)
+
+    seeds = [0] * num_buckets
+    slots = [None] * size
+    for bucket in sorted(range(num_buckets), key=lambda b: -len(buckets[b])):
+        for seed in range(max_seed):
+            positions = [mix32(crcs[key] ^ seed) % size for key in buckets[bucket]]
+            if len(set(positions)) == len(positions) and all(slots[p] is None for p in positions):
+                break
+        else:
+            raise ValueError(f"No displacement seed below {max_seed} for a bucket of {len(buckets[bucket])} keys")
+        seeds[bucket] = seed
+        for key, position in zip(buckets[bucket], positions):
+            slots[position] = key
+    return seeds, slots
+
+
+def make_chd_lookup(hash_to_model: dict, seeds: list[int], slots: list[str | None]):
+    """CHD minimal perfect hash: one crc32, one mix and a key check, no dict probe."""
+    names = [hash_to_model[cid] for cid in slots]
+    size = len(slots)
+    num_buckets = len(seeds)
+
+    def lookup(cid, crc32=zlib.crc32, mix32=mix32):
+        h = crc32(cid.encode())
+        i = mix32(h ^ seeds[h % num_buckets]) % size
+        if slots[i] == cid:
+            return names[i]
+        return None
+
+    return lookup
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=1_000_000, help="Lookups per candidate")
+    args = parser.parse_args()
+
+    models = load_models_module()
+    hashes = list(models.HASH_TO_MODEL)
+    seeds, slots = build_chd(hashes)
+    print(f"CHD: {len(slots)} keys, {len(seeds)} seeds, max seed {max(seeds)}")
+    candidates = {
+        "dict.get (hash_to_model)": models.hash_to_model,
+        "sorted tuple + bisect": make_sorted_lookup(models.HASH_TO_MODEL),
+        "CHD perfect hash (crc32)": make_chd_lookup(models.HASH_TO_MODEL, seeds, slots),
+    }
+
+    for name, lookup in candidates.items():
+        for cid in hashes:
+            if lookup(cid) != models.HASH_TO_MODEL[cid]:
+                print(f"{name}: wrong result for {cid}", file=sys.stderr)
+                return 1
+        if lookup("bafkrei-unknown") is not None:
+            print(f"{name}: unknown hash did not return None", file=sys.stderr)
+            return 1
+
+    for name, lookup in candidates.items():
+        elapsed = timeit.timeit(lambda: [lookup(cid) for cid in hashes], number=args.number // len(hashes))
+        per_lookup_ns = elapsed / (args.number // len(hashes) * len(hashes)) * 1e9
+        print(f"{name:<28} {per_lookup_ns:8.1f} ns/lookup")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
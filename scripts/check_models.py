@@ -0,0 +1,140 @@
+"""
+Validate the model tables in eternal_zoo/models.toml.
+
+Checks that every hash is a well-formed CIDv1 sha2-256 hash, that no two
+hashes share a digest, that hashes and model names map one-to-one, that
+every hash names a featured model and that every featured model config has
+the fields its backend needs. eternal_zoo.models does none of this at
+import time; run this in CI instead.
+
+Usage:
+    python scripts/check_models.py  # exit 1 on any problem (CI)
+"""
+
+import sys
+import base64
+import tomllib
+
+from models_module import PACKAGE_DIR, load_models_module
+
+DATA_PATH = PACKAGE_DIR / "models.toml"
+
+# CIDv1, raw codec, sha2-256 multihash with a 32-byte digest ("bafkrei..." in base32)
+CID_HEADER = bytes([0x01, 0x55, 0x12, 0x20])
+DIGEST_SIZE = 32
+
+# Fields each backend needs to download and launch a model
+REQUIRED_FIELDS = {
+    "gguf": ("repo",),
+    "mlx-lm": ("hf-repo",),
+    "mlx-flux": ("repo", "architecture"),
+}
+
+
+def cid_digest(cid: str) -> bytes:
+    """Decode a base32 CIDv1 string into its raw sha2-256 digest."""
+    if not cid.startswith("b"):
+        raise ValueError("not a base32 multibase string")
+    encoded = cid[1:].upper()
+    raw = base64.b32decode(encoded + "=" * (-len(encoded) % 8))
+    if raw[:len(CID_HEADER)] != CID_HEADER or len(raw) != len(CID_HEADER) + DIGEST_SIZE:
+        raise ValueError("not a CIDv1 raw sha2-256 hash")
+    return raw[len(CID_HEADER):]
+
+
+def check_cids(hash_to_model: dict) -> list[str]:
+    """Return a list of problems for hashes that are malformed or share a digest."""
+    errors = []
+    seen = {}
+    for cid, model in hash_to_model.items():
+        try:
+            digest = cid_digest(cid)
+        except ValueError as e:
+            errors.append(f"Invalid hash {cid} for {model}: {e}")
+            continue
+        if digest in seen:
+            errors.append(f"Hashes for {seen[digest]} and {model} decode to the same digest")
+        seen[digest] = model
+    return errors
+
+
+def check_one_to_one(hash_to_model: dict) -> list[str]:
+    """Return a list of problems if several hashes map to the same model name."""
+    errors = []
+    seen = {}
+    for cid, model in hash_to_model.items():
+        if model in seen:
+            errors.append(f"Model {model} has several hashes: {seen[model]} and {cid}")
+        seen[model] = cid
+    return errors
+
+
+def check_hashes_featured(hash_to_model: dict, featured: dict) -> list[str]:
+    """Return a list of problems for hashes whose model is not featured.
+
+    Featured models without a hash are allowed: they are downloaded straight
+    from Hugging Face.
+    """
+    return [
+        f"Hash {cid} maps to {model}, which is not a featured model"
+        for cid, model in hash_to_model.items()
+        if model not in featured
+    ]
+
+
+def check_featured_configs(featured: dict, hash_to_model: dict, models) -> list[str]:
+    """Return a list of problems with the per-model configs."""
+    errors = []
+    tasks = {task.label for task in models.Task}
+    backends = {backend.label for backend in models.Backend}
+    hashed_models = set(hash_to_model.values())
+
+    for name, config in featured.items():
+        task = config.get("task")
+        backend = config.get("backend")
+        if task not in tasks:
+            errors.append(f"{name}: unknown task {task!r}")
+        if backend not in backends:
+            errors.append(f"{name}: unknown backend {backend!r}")
+            continue
+
+        for field in REQUIRED_FIELDS.get(backend, ()):
+            if not config.get(field):
+                errors.append(f"{name}: {backend} models need '{field}'")
+        if backend == "gguf" and not (config.get("model") or config.get("pattern")):
+            errors.append(f"{name}: gguf models need 'model' or 'pattern'")
+
+        if config.get("lora"):
+            base_model = config.get("base_model")
+            if base_model not in featured:
+                errors.append(f"{name}: LoRA base model {base_model!r} is not a featured model")
+            elif base_model not in hashed_models:
+                errors.append(f"{name}: LoRA base model {base_model} has no hash")
+
+        try:
+            models.ModelSpec.from_config(config)
+        except KeyError as e:
+            errors.append(f"{name}: missing field {e}")
+        except (TypeError, ValueError) as e:
+            errors.append(f"{name}: {e}")
+    return errors
+
+
+def main() -> int:
+    with open(DATA_PATH, "rb") as f:
+        data = tomllib.load(f)
+    models = load_models_module()
+
+    hash_to_model = data.get("hashes", {})
+    featured = data.get("models", {})
+    errors = check_one_to_one(hash_to_model)
+    errors += check_cids(hash_to_model)
+    errors += check_hashes_featured(hash_to_model, featured)
+    errors += check_featured_configs(featured, hash_to_model, models)
+    for error in errors:
+        print(error, file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+"""
+Shared helper for the scripts that inspect eternal_zoo/models.py.
+"""
+
+import importlib.util
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "eternal_zoo"
+MODELS_PATH = PACKAGE_DIR / "models.py"
+
+
+def load_models_module():
+    """Load models.py directly so the eternal_zoo package __init__ is not executed."""
+    spec = importlib.util.spec_from_file_location("_eternal_zoo_models", MODELS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
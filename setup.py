@@ -12,6 +12,7 @@ setup(
     packages=find_packages(),
     package_data={
         "eternal_zoo": [
+            "models.toml",
             "examples/templates/*.jinja",
             "examples/best_practices/*.json",
         ],